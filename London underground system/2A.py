@@ -68,7 +68,8 @@ def main():
     start_idx = station_to_id[start_label] #converting "A" to 0
     end_idx = station_to_id[end_label]  #converting "E" to 4
 
-    distances, predecessors = dijkstra(graph, start_idx)
+    # Only one destination is needed, so stop once it is settled.
+    distances, predecessors, _ = dijkstra(graph, start_idx, targets=[end_idx])
 
     path_indices = reconstruct_path(predecessors, start_idx, end_idx)
     path_labels = [id_to_station[i] for i in path_indices] #converting numbers back to station labels again
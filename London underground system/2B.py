@@ -6,6 +6,8 @@ import os
 import time
 import random
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 
 # Configure module paths
@@ -17,8 +19,7 @@ sys.path.extend([
     os.path.join(base_path, 'clrsPython', 'Chapter 10')
 ])
 
-from dijkstra import dijkstra
-from adjacency_list_graph import AdjacencyListGraph
+from clrsPython import AdjacencyListGraph, dijkstra, dijkstra_fast
 
 
 def create_sparse_graph(num_nodes, rng_seed=7):
@@ -74,21 +75,59 @@ def convert_dict_to_graph(adj_dict):
     return graph, index_map
 
 
+# Per-worker state for the parallel benchmark: each worker builds a synthetic
+# graph once per (builder, size, seed) and reuses it for all of its trials.
+_worker_graphs = {}
+
+
+def _init_benchmark_worker(cpu_queue):
+    """Pin this worker process to one CPU (where supported) to reduce timing noise."""
+    if cpu_queue is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {cpu_queue.get(timeout=1)})
+    except Exception:
+        pass  # more workers than CPUs, or pinning not permitted: run unpinned
+
+
+def _run_trials(graph_builder, shortest_path_func, network_size, graph_seed, pair_seed, num_trials):
+    """Worker: time num_trials shortest-path queries on a cached synthetic graph."""
+    key = (graph_builder, network_size, graph_seed)
+    if key not in _worker_graphs:
+        graph_dict = graph_builder(network_size, graph_seed)
+        graph_obj, node_map = convert_dict_to_graph(graph_dict)
+        _worker_graphs[key] = (graph_obj, node_map, list(graph_dict.keys()))
+    graph_obj, node_map, vertex_list = _worker_graphs[key]
+
+    analyzer = PerformanceAnalyzer(graph_builder, graph_seed, shortest_path_func)
+    rng = random.Random(pair_seed)
+    execution_times = []
+    for _ in range(num_trials):
+        source = rng.choice(vertex_list)
+        destination = rng.choice(vertex_list)
+        while destination == source:
+            destination = rng.choice(vertex_list)
+        execution_times.append(analyzer.measure_single_run(graph_obj, node_map, source, destination))
+    return network_size, execution_times
+
+
 class PerformanceAnalyzer:
     """Encapsulates performance measurement for shortest path algorithms."""
     
-    def __init__(self, graph_builder=None, random_seed=7):
+    def __init__(self, graph_builder=None, random_seed=7, shortest_path_func=None):
         self.graph_builder = graph_builder or create_sparse_graph
+        self.shortest_path_func = shortest_path_func or dijkstra
         self.rng = random.Random(random_seed)
         self.random_seed = random_seed
     
     def measure_single_run(self, graph_obj, index_mapping, start_node, target_node):
-        """Execute Dijkstra's algorithm once and return execution duration."""
+        """Execute Dijkstra's algorithm once and return execution duration.
+        The search stops as soon as the target node is settled."""
         start_idx = index_mapping[start_node]
         target_idx = index_mapping[target_node]
         
         begin_time = time.perf_counter()
-        distances, predecessors = dijkstra(graph_obj, start_idx)
+        distances, predecessors, _ = self.shortest_path_func(graph_obj, start_idx, targets=[target_idx])
         elapsed = time.perf_counter() - begin_time
         
         # Access result to ensure computation completes
@@ -143,6 +182,46 @@ class PerformanceAnalyzer:
         ci_margin = z_95 * std_error
         
         return mean_time, std_dev, ci_margin
+    
+    def compute_runtimes_parallel(self, network_sizes, num_iterations=100, max_workers=None,
+                                  trials_per_task=10, pin_workers=True):
+        """Run the benchmark for several graph sizes across a pool of worker processes.
+        
+        The (size, trial) work is split into tasks of trials_per_task trials. Each worker
+        builds the graph for a size once and reuses it for every task of that size.
+        With pin_workers, each worker is bound to its own CPU where the OS allows it.
+        
+        Returns dict: size -> (mean_time, std_dev, ci_margin), as compute_statistics.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        
+        cpu_queue = None
+        if pin_workers and hasattr(os, "sched_getaffinity"):
+            cpu_queue = multiprocessing.Queue()
+            for cpu in sorted(os.sched_getaffinity(0)):
+                cpu_queue.put(cpu)
+        
+        # Shard into tasks; each task has its own seed for drawing (source, destination) pairs.
+        tasks = []
+        for size in network_sizes:
+            for start in range(0, num_iterations, trials_per_task):
+                trials = min(trials_per_task, num_iterations - start)
+                tasks.append((size, self.rng.randrange(2 ** 32), trials))
+        
+        execution_times = {size: [] for size in network_sizes}
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_benchmark_worker,
+                                 initargs=(cpu_queue,)) as pool:
+            futures = [
+                pool.submit(_run_trials, self.graph_builder, self.shortest_path_func,
+                            size, self.random_seed, pair_seed, trials)
+                for size, pair_seed, trials in tasks
+            ]
+            for future in futures:
+                size, times = future.result()
+                execution_times[size].extend(times)
+        
+        return {size: self.compute_statistics(execution_times[size]) for size in network_sizes}
 
 
 def visualize_results(graph_sizes, timing_results, error_bars=None, num_trials=100):
@@ -174,24 +253,36 @@ def visualize_results(graph_sizes, timing_results, error_bars=None, num_trials=1
     plt.show()
 
 
-def main():
-    """Main execution routine."""
-    analyzer = PerformanceAnalyzer(random_seed=7)
+def main(parallel=False):
+    """Main execution routine. With parallel=True the trials run in a process pool."""
+    # Lazy-deletion binary heap Dijkstra. Runs stop at the target, and dijkstra with targets
+    # hands off to dijkstra_fast (dijkstra_radix only for a CSRGraph), so the CLRS
+    # MinHeapPriorityQueue path cannot be timed through measure_single_run.
+    analyzer = PerformanceAnalyzer(random_seed=7, shortest_path_func=dijkstra_fast)
     test_sizes = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
     num_trials = 100
     
     print("Running performance analysis...")
     performance_data = []
     error_data = []
-    for size in test_sizes:
-        avg_time, std_dev = analyzer.compute_average_runtime(size, num_iterations=num_trials)
-        performance_data.append(avg_time)
-        error_data.append(std_dev)
-        print(f"Size {size}: {avg_time:.6f}s average (±{std_dev:.6f}s std dev)")
+    if parallel:
+        results = analyzer.compute_runtimes_parallel(test_sizes, num_iterations=num_trials)
+        for size in test_sizes:
+            avg_time, std_dev, ci_margin = results[size]
+            performance_data.append(avg_time)
+            error_data.append(std_dev)
+            print(f"Size {size}: {avg_time:.6f}s average (±{std_dev:.6f}s std dev, "
+                  f"95% CI ±{ci_margin:.6f}s)")
+    else:
+        for size in test_sizes:
+            avg_time, std_dev = analyzer.compute_average_runtime(size, num_iterations=num_trials)
+            performance_data.append(avg_time)
+            error_data.append(std_dev)
+            print(f"Size {size}: {avg_time:.6f}s average (±{std_dev:.6f}s std dev)")
     
     visualize_results(test_sizes, performance_data, error_bars=error_data, num_trials=num_trials)
 
 
 if __name__ == "__main__":
-    main()
+    main(parallel="--parallel" in sys.argv[1:])
 
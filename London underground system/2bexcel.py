@@ -1,187 +1,558 @@
-# 2(b) — London Underground shortest-time paths (CLRS Dijkstra)
-# - Loads network from Excel
-# - Cleans & deduplicates edges (keep MIN time per station pair)
-# - Runs two tests: short and long journey
-# - Uses ONLY CLRS library functions for the algorithm & path printing
-
-import os
-import sys
-import pandas as pd
-
-# ---------- Locate this script's folder ----------
-if '__file__' in globals():
-    BASE = os.path.dirname(os.path.abspath(__file__))
-else:
-    BASE = os.getcwd()
-
-# ---------- Add CLRS library folders to path (adjust only if your layout differs) ----------
-sys.path.extend([
-    os.path.join(BASE, 'clrsPython', 'Chapter 22'),
-    os.path.join(BASE, 'clrsPython', 'Chapter 20'),
-    os.path.join(BASE, 'clrsPython', 'Chapter 10'),
-    os.path.join(BASE, 'clrsPython', 'Chapter 6'),
-    os.path.join(BASE, 'clrsPython', 'Utility functions'),
-])
-
-# ---------- CLRS imports (algorithm, graph, path printer) ----------
-from dijkstra import dijkstra                      # CLRS shortest-time algorithm
-from adjacency_list_graph import AdjacencyListGraph
-from print_path import print_path                  # CLRS path printer
-
-
-# ---------- Data loader (robust to 3 or 4 columns, dedup to MIN time) ----------
-def load_london_underground_from_excel(excel_file):
-    """
-    Build a weighted, undirected graph from an LU Excel file.
-    Accepts either:
-      - 3 columns: From, To, Minutes
-      - 4 columns: Line, From, To, Minutes
-    Returns: (Graph, station_to_index, index_to_station)
-    """
-    if not os.path.exists(excel_file):
-        raise FileNotFoundError(f"Excel file not found: {excel_file}")
-
-    # Try with a header row first (rename flexibly), else fallback to raw and assign names
-    df = None
-    try:
-        df0 = pd.read_excel(excel_file, header=0)
-        cols_lower = [str(c).strip().lower() for c in df0.columns]
-        rename_map = {}
-        for raw, c in zip(df0.columns, cols_lower):
-            if 'from' in c:
-                rename_map[raw] = 'From'
-            elif c == 'to' or 'to' in c:
-                rename_map[raw] = 'To'
-            elif 'minute' in c or 'time' in c or 'duration' in c:
-                rename_map[raw] = 'Minutes'
-            elif 'line' in c:
-                rename_map[raw] = 'Line'
-        if {'From', 'To', 'Minutes'}.issubset(set(rename_map.values())):
-            keep = ['From', 'To', 'Minutes']
-            if 'Line' in rename_map.values():
-                keep.append('Line')
-            df = df0.rename(columns=rename_map)[keep]
-    except Exception:
-        pass
-
-    if df is None:
-        df_raw = pd.read_excel(excel_file, header=None)
-        ncols = df_raw.shape[1]
-        if ncols == 4:
-            df_raw.columns = ['Line', 'From', 'To', 'Minutes']
-        elif ncols == 3:
-            df_raw.columns = ['From', 'To', 'Minutes']
-        else:
-            raise ValueError(f"Unexpected number of columns: {ncols} (expected 3 or 4)")
-        df = df_raw
-
-    if df.empty:
-        raise ValueError("Excel file contains no data rows")
-
-    # Clean names and times; drop heading/blank rows
-    df['From'] = df['From'].astype(str).str.strip()
-    df['To']   = df['To'].astype(str).str.strip()
-    df['Minutes'] = pd.to_numeric(df['Minutes'], errors='coerce')
-
-    df = df[
-        (df['From'].ne('')) & (df['From'].str.lower().ne('nan')) &
-        (df['To'].ne(''))   & (df['To'].str.lower().ne('nan')) &
-        (df['Minutes'].notna())
-    ].copy()
-
-    if df.empty:
-        raise ValueError("No valid connection rows after cleaning")
-
-    if (df['Minutes'] < 0).any():
-        raise ValueError("Found negative durations; please fix the data")
-
-    # Deduplicate: undirected pair -> keep MIN time
-    df['u'] = df[['From', 'To']].min(axis=1)
-    df['v'] = df[['From', 'To']].max(axis=1)
-    df_edges = df.groupby(['u', 'v'], as_index=False)['Minutes'].min()
-
-    # Build station index maps
-    stations = sorted(set(df_edges['u']) | set(df_edges['v']))
-    to_idx = {s: i for i, s in enumerate(stations)}
-    to_name = {i: s for s, i in to_idx.items()}
-
-    # Build weighted, undirected graph
-    G = AdjacencyListGraph(len(stations), directed=False, weighted=True)
-    for _, r in df_edges.iterrows():
-        G.insert_edge(to_idx[r['u']], to_idx[r['v']], float(r['Minutes']))
-
-    print(f"Successfully loaded {len(df_edges)} connections between {len(stations)} stations")
-    return G, to_idx, to_name
-
-
-# ---------- Helpers ----------
-def find_station_name(query, to_idx):
-    """Case-insensitive, trimmed station lookup."""
-    q = query.strip()
-    if q in to_idx:
-        return q
-    ql = q.lower()
-    for name in to_idx.keys():
-        if name.lower() == ql:
-            return name
-    return None
-
-
-def run_test(G, to_idx, to_name, start, end, label):
-    print(f"\n=== {label} ===")
-    print(f"Input: {start} → {end}")
-
-    s_name = find_station_name(start, to_idx)
-    t_name = find_station_name(end, to_idx)
-    if s_name is None or t_name is None:
-        print("Station name not found in network.")
-        return
-
-    s, t = to_idx[s_name], to_idx[t_name]
-
-    # CLRS Dijkstra call (algorithm)
-    dist, pred = dijkstra(G, s)
-
-    # CLRS path printer (no custom reconstruction)
-    route = print_path(pred, s, t, lambda i: to_name[i])
-
-    if not route:
-        print("No route found.")
-        return
-
-    print("Route:", " → ".join(route))
-    print("Total journey time:", dist[t], "minutes")
-    print("Number of stations:", len(route))
-
-
-# ---------- Main ----------
-def main():
-    # Try common filenames in the script folder
-    candidates = [
-        os.path.join(BASE, "London Underground data.xlsx"),
-        os.path.join(BASE, "London_Underground.xlsx"),
-        os.path.join(BASE, "London Underground.xlsx"),
-    ]
-    excel_file = next((p for p in candidates if os.path.exists(p)), None)
-    if excel_file is None:
-        # Let user provide a path if the common names aren't found
-        excel_file = input("Excel path: ").strip()
-
-    print(f"Loading London Underground network from '{excel_file}'...")
-    try:
-        G, to_idx, to_name = load_london_underground_from_excel(excel_file)
-        print(f"Network loaded. Stations: {len(to_idx)}")
-    except Exception as e:
-        print("Error loading Excel:", e)
-        print("Ensure the sheet has columns (From, To, Minutes) "
-              "or (Line, From, To, Minutes).")
-        return
-
-    # Spec asks for TWO tests: one short, one long
-    run_test(G, to_idx, to_name, "Covent Garden", "Leicester Square", "SHORT JOURNEY (CLRS Dijkstra)")
-    run_test(G, to_idx, to_name, "Wimbledon", "Stratford", "LONG JOURNEY (CLRS Dijkstra)")
-
-    print("\nAll tests complete. Take screenshots of the outputs above for your report.")
-
-if __name__ == "__main__":
-    main()
+# 2(b) — London Underground shortest-time paths (CLRS Dijkstra)
+# - Loads network from Excel
+# - Cleans & deduplicates edges (keep MIN time per station pair)
+# - Runs two tests: short and long journey
+# - Uses ONLY CLRS library functions for the algorithm & path printing
+#   (Dijkstra with a lazy-deletion binary heap from clrsPython)
+
+import os
+import sys
+import math
+import hashlib
+from functools import partial
+import numpy as np
+import pandas as pd
+
+# ---------- Locate this script's folder ----------
+if '__file__' in globals():
+    BASE = os.path.dirname(os.path.abspath(__file__))
+else:
+    BASE = os.getcwd()
+
+# ---------- Add CLRS library folders to path (adjust only if your layout differs) ----------
+sys.path.extend([
+    os.path.join(BASE, 'clrsPython', 'Chapter 22'),
+    os.path.join(BASE, 'clrsPython', 'Chapter 20'),
+    os.path.join(BASE, 'clrsPython', 'Chapter 10'),
+    os.path.join(BASE, 'clrsPython', 'Chapter 6'),
+    os.path.join(BASE, 'clrsPython', 'Utility functions'),
+])
+
+# ---------- CLRS imports (algorithm, graph, path printer) ----------
+from clrsPython import dijkstra_fast               # CLRS shortest-time algorithm (binary heap)
+from clrsPython import yen_k_shortest_paths        # ranked alternative routes
+from clrsPython import bidirectional_dijkstra      # meet-in-the-middle variant for long journeys
+from clrsPython import astar                       # goal-directed search (needs station coordinates)
+from contraction_hierarchy import ContractionHierarchy  # preprocessed routing for many queries
+from journey_service import JourneyService         # LRU cache of shortest-path trees
+from clrsPython import all_pairs_shortest_paths, predecessor_list  # full travel-time matrix
+from clrsPython import AdjacencyListGraph          # CLRS graph (with bulk edge loader)
+from clrsPython import CSRGraph, multi_source_dijkstra  # line-expanded (station, line) routing
+from print_path import print_path                  # CLRS path printer
+
+
+# ---------- Data loader (robust to 3 or 4 columns, dedup to MIN time) ----------
+def read_connections_from_excel(excel_file):
+    """
+    Read and clean the connection rows of an LU Excel file.
+    Accepts either:
+      - 3 columns: From, To, Minutes
+      - 4 columns: Line, From, To, Minutes
+    Returns: DataFrame with columns From, To, Minutes (and Line if present)
+    """
+    if not os.path.exists(excel_file):
+        raise FileNotFoundError(f"Excel file not found: {excel_file}")
+
+    # Try with a header row first (rename flexibly), else fallback to raw and assign names
+    df = None
+    try:
+        df0 = pd.read_excel(excel_file, header=0)
+        cols_lower = [str(c).strip().lower() for c in df0.columns]
+        rename_map = {}
+        for raw, c in zip(df0.columns, cols_lower):
+            if 'from' in c:
+                rename_map[raw] = 'From'
+            elif c == 'to' or 'to' in c:
+                rename_map[raw] = 'To'
+            elif 'minute' in c or 'time' in c or 'duration' in c:
+                rename_map[raw] = 'Minutes'
+            elif 'line' in c:
+                rename_map[raw] = 'Line'
+        if {'From', 'To', 'Minutes'}.issubset(set(rename_map.values())):
+            keep = ['From', 'To', 'Minutes']
+            if 'Line' in rename_map.values():
+                keep.append('Line')
+            df = df0.rename(columns=rename_map)[keep]
+    except Exception:
+        pass
+
+    if df is None:
+        df_raw = pd.read_excel(excel_file, header=None)
+        ncols = df_raw.shape[1]
+        if ncols == 4:
+            df_raw.columns = ['Line', 'From', 'To', 'Minutes']
+        elif ncols == 3:
+            df_raw.columns = ['From', 'To', 'Minutes']
+        else:
+            raise ValueError(f"Unexpected number of columns: {ncols} (expected 3 or 4)")
+        df = df_raw
+
+    if df.empty:
+        raise ValueError("Excel file contains no data rows")
+
+    # Clean names and times; drop heading/blank rows
+    df['From'] = df['From'].astype(str).str.strip()
+    df['To']   = df['To'].astype(str).str.strip()
+    df['Minutes'] = pd.to_numeric(df['Minutes'], errors='coerce')
+
+    df = df[
+        (df['From'].ne('')) & (df['From'].str.lower().ne('nan')) &
+        (df['To'].ne(''))   & (df['To'].str.lower().ne('nan')) &
+        (df['Minutes'].notna())
+    ].copy()
+
+    if df.empty:
+        raise ValueError("No valid connection rows after cleaning")
+
+    if (df['Minutes'] < 0).any():
+        raise ValueError("Found negative durations; please fix the data")
+
+    return df
+
+
+def load_london_underground_from_excel(excel_file):
+    """
+    Build a weighted, undirected graph from an LU Excel file
+    (see read_connections_from_excel for the accepted layouts).
+    Returns: (Graph, station_to_index, index_to_station)
+    """
+    df = read_connections_from_excel(excel_file)
+
+    # Build station index maps
+    stations = sorted(set(df['From']) | set(df['To']))
+    to_idx = {s: i for i, s in enumerate(stations)}
+    to_name = {i: s for s, i in to_idx.items()}
+
+    # Build weighted, undirected graph in one sweep.
+    # Deduplicate: undirected pair -> keep MIN time
+    G = AdjacencyListGraph.from_edges(
+        len(stations),
+        df['From'].map(to_idx).to_numpy(),
+        df['To'].map(to_idx).to_numpy(),
+        df['Minutes'].to_numpy(dtype=float),
+        directed=False, weighted=True, dedupe="min",
+    )
+
+    print(f"Successfully loaded {G.get_card_E()} connections between {len(stations)} stations")
+    return G, to_idx, to_name
+
+
+# ---------- Line-expanded network (interchange penalties) ----------
+DEFAULT_TRANSFER_MINUTES = 5
+UNNAMED_LINE = "(unnamed line)"
+
+
+def load_line_expanded_network(excel_file, transfer_minutes=DEFAULT_TRANSFER_MINUTES,
+                               station_transfer_minutes=None):
+    """
+    Build a line-aware network from an LU Excel file with a Line column.
+    Each node is a (station, line) pair served by that line; riding between
+    neighbouring stations stays on the line (MIN time per pair, as in the
+    station graph), and changing lines at a station is an interchange edge
+    between its (station, line) nodes costing transfer_minutes
+    (or station_transfer_minutes[station], if given for that station).
+    The graph is stored in CSR arrays.
+    Returns: (Graph, node_station, node_line, station_nodes) where
+      node_station[v] / node_line[v] name node v and
+      station_nodes[name] lists the nodes of that station.
+    """
+    df = read_connections_from_excel(excel_file)
+    if 'Line' not in df.columns:
+        raise ValueError("Line-aware routing needs a Line column (Line, From, To, Minutes)")
+    # Rows with a blank line name keep their connection on a line of their own
+    df['Line'] = df['Line'].fillna('').astype(str).str.strip().replace('', UNNAMED_LINE)
+    station_transfer_minutes = station_transfer_minutes or {}
+
+    # One node per (station, line) pair
+    pairs = sorted(set(zip(df['From'], df['Line'])) | set(zip(df['To'], df['Line'])))
+    node_of = {pair: v for v, pair in enumerate(pairs)}
+    node_station = [station for station, _ in pairs]
+    node_line = [line for _, line in pairs]
+    station_nodes = {}
+    for v, station in enumerate(node_station):
+        station_nodes.setdefault(station, []).append(v)
+
+    # Ride edges: same line, MIN time per undirected node pair
+    us = np.array([node_of[p] for p in zip(df['From'], df['Line'])], dtype=np.int64)
+    vs = np.array([node_of[p] for p in zip(df['To'], df['Line'])], dtype=np.int64)
+    ws = df['Minutes'].to_numpy(dtype=float)
+    keep = us != vs
+    lo, hi, ws = np.minimum(us, vs)[keep], np.maximum(us, vs)[keep], ws[keep]
+    rides = pd.DataFrame({'u': lo, 'v': hi, 'w': ws}).groupby(['u', 'v'], sort=True)['w'].min()
+
+    # Interchange edges: every pair of lines at the same station
+    change_u, change_v, change_w = [], [], []
+    for station, nodes in station_nodes.items():
+        minutes = station_transfer_minutes.get(station, transfer_minutes)
+        for i, a in enumerate(nodes):
+            for b in nodes[i + 1:]:
+                change_u.append(a)
+                change_v.append(b)
+                change_w.append(minutes)
+
+    G = CSRGraph.from_edges(
+        len(pairs),
+        np.concatenate((rides.index.get_level_values('u').to_numpy(), change_u)).astype(np.int64),
+        np.concatenate((rides.index.get_level_values('v').to_numpy(), change_v)).astype(np.int64),
+        np.concatenate((rides.to_numpy(), change_w)),
+        directed=False,
+    )
+    print(f"Line-expanded network: {G.get_card_V()} (station, line) nodes, "
+          f"{len(rides)} ride and {len(change_u)} interchange edges")
+    return G, node_station, node_line, station_nodes
+
+
+def route_with_changes(network, start, end):
+    """
+    Fastest journey from station start to station end on a network from
+    load_line_expanded_network, boarding any line at start and leaving
+    from any line at end.
+    Returns: (total_minutes, changes, path) where path lists (station, line)
+    nodes; total_minutes is infinity and path is empty if end is unreachable.
+    """
+    G, node_station, node_line, station_nodes = network
+    targets = station_nodes[end]
+    dist, pred, _, _ = multi_source_dijkstra(G, station_nodes[start], targets=targets)
+    t = min(targets, key=lambda v: dist[v])
+    if dist[t] == math.inf:
+        return math.inf, 0, []
+
+    path = [t]
+    while pred[path[-1]] is not None:
+        path.append(pred[path[-1]])
+    path.reverse()
+    # An edge between two nodes of the same station is a change of line.
+    changes = sum(1 for a, b in zip(path, path[1:]) if node_station[a] == node_station[b])
+    return dist[t], changes, path
+
+
+# ---------- Optional station coordinates (sidecar CSV) ----------
+def load_station_coordinates(coords_file, to_idx):
+    """
+    Read station coordinates from a sidecar CSV with columns Station, Latitude, Longitude
+    (header names matched case-insensitively; 'lat'/'lon'/'lng' also accepted).
+    Returns: list indexed like the graph, holding (lat, lon) or None for stations
+    missing from the file.
+    """
+    if not os.path.exists(coords_file):
+        raise FileNotFoundError(f"Coordinates file not found: {coords_file}")
+
+    df = pd.read_csv(coords_file)
+    rename_map = {}
+    for raw in df.columns:
+        c = str(raw).strip().lower()
+        if 'station' in c or c == 'name':
+            rename_map[raw] = 'Station'
+        elif c.startswith('lat'):
+            rename_map[raw] = 'Latitude'
+        elif c.startswith('lon') or c.startswith('lng'):
+            rename_map[raw] = 'Longitude'
+    df = df.rename(columns=rename_map)
+    if not {'Station', 'Latitude', 'Longitude'}.issubset(df.columns):
+        raise ValueError("Coordinates file needs columns Station, Latitude, Longitude")
+
+    coords = [None] * len(to_idx)
+    for name, lat, lon in zip(df['Station'].astype(str).str.strip(), df['Latitude'], df['Longitude']):
+        station = find_station_name(name, to_idx)
+        if station is not None and pd.notna(lat) and pd.notna(lon):
+            coords[to_idx[station]] = (float(lat), float(lon))
+    return coords
+
+
+def haversine_km(a, b):
+    """Great-circle distance in km between two (lat, lon) points."""
+    lat1, lon1 = map(math.radians, a)
+    lat2, lon2 = map(math.radians, b)
+    h = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * 6371.0 * math.asin(math.sqrt(h))
+
+
+def network_max_speed(G, coords):
+    """
+    Fastest speed (km per minute) observed on any edge of the network, computed
+    once per (G, coords) and passed to make_geographic_heuristic for every query.
+    Returns None if any station has no coordinates, an edge has zero minutes
+    between distinct places, or no edge has any length, since then no speed
+    bound holds.
+    """
+    if any(c is None for c in coords):
+        return None
+    max_speed = 0.0
+    for u in range(G.get_card_V()):
+        for edge in G.get_adj_list(u):
+            km = haversine_km(coords[u], coords[edge.get_v()])
+            if edge.get_weight() <= 0:
+                if km > 0:
+                    return None
+                continue
+            max_speed = max(max_speed, km / edge.get_weight())
+    return max_speed if max_speed > 0 else None
+
+
+def make_geographic_heuristic(coords, t, max_speed):
+    """
+    A* heuristic for target t: straight-line distance to t divided by max_speed
+    from network_max_speed. No edge is faster, so no path can beat this bound and
+    the heuristic is admissible. With max_speed None this is the zero heuristic
+    (plain Dijkstra).
+    """
+    if max_speed is None:
+        return lambda v: 0
+    target = coords[t]
+    return lambda v: haversine_km(coords[v], target) / max_speed
+
+
+# ---------- Helpers ----------
+def find_station_name(query, to_idx):
+    """Case-insensitive, trimmed station lookup."""
+    q = query.strip()
+    if q in to_idx:
+        return q
+    ql = q.lower()
+    for name in to_idx.keys():
+        if name.lower() == ql:
+            return name
+    return None
+
+
+# ---------- Contraction hierarchy (offline preprocessing, cached on disk) ----------
+def file_sha256(path):
+    """Hex SHA-256 of a file's contents (identifies the input data)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_or_build_hierarchy(G, excel_file):
+    """
+    Return the contraction hierarchy for the network in excel_file.
+    The hierarchy is stored next to the Excel file (<name>.ch.npz) and rebuilt
+    only when the Excel contents change.
+    """
+    ch_file = os.path.splitext(excel_file)[0] + ".ch.npz"
+    digest = file_sha256(excel_file)
+    if os.path.exists(ch_file):
+        ch = ContractionHierarchy.load(ch_file)
+        if ch.source == digest and ch.card_V == G.get_card_V():
+            return ch
+    ch = ContractionHierarchy.build(G, source=digest)
+    ch.save(ch_file)
+    print(f"Contraction hierarchy saved to '{ch_file}'")
+    return ch
+
+
+# ---------- All-pairs travel-time matrix (computed once, memory-mapped afterwards) ----------
+def load_or_compute_travel_matrix(G, excel_file, processes=None):
+    """
+    Return (dist, pred) for every station pair, as read-only memory-mapped arrays.
+    The matrices are cached next to the Excel file, keyed by a hash of its contents,
+    so later runs read them from disk instead of rerunning Dijkstra.
+    """
+    digest = file_sha256(excel_file)[:16]
+    cache_path = os.path.join(os.path.dirname(os.path.abspath(excel_file)), f"travel_times_{digest}")
+    return all_pairs_shortest_paths(G, processes=processes, cache_path=cache_path)
+
+
+# ---------- Routing methods: each returns (total_minutes, pred) for print_path ----------
+def route_dijkstra(G, s, t):
+    """CLRS Dijkstra call (algorithm), stopping once the destination is settled."""
+    dist, pred, _ = dijkstra_fast(G, s, targets=[t])
+    return dist[t], pred
+
+
+def route_bidirectional(G, s, t):
+    """Searches from both ends, best for long journeys."""
+    total, pred, _ = bidirectional_dijkstra(G, s, t)
+    return total, pred
+
+
+def route_astar(G, s, t, coords, max_speed):
+    """
+    Goal-directed search; coords come from load_station_coordinates and
+    max_speed from network_max_speed.
+    """
+    dist, pred, _ = astar(G, s, t, make_geographic_heuristic(coords, t, max_speed))
+    return dist[t], pred
+
+
+def route_ch(G, s, t, ch):
+    """Contraction-hierarchy query; ch comes from load_or_build_hierarchy."""
+    total, pred, _ = ch.query(s, t)
+    return total, pred
+
+
+def route_matrix(G, s, t, matrix):
+    """Lookup in the matrix from load_or_compute_travel_matrix."""
+    dist_matrix, pred_matrix = matrix
+    return float(dist_matrix[s, t]), predecessor_list(pred_matrix, s)
+
+
+def route_service(G, s, t, service):
+    """
+    Full shortest-path tree from s, answered from the JourneyService's cache,
+    so repeated journeys from a source skip Dijkstra.
+    """
+    dist, pred = service.shortest_path_tree(s)
+    return dist[t], pred
+
+
+def find_journey(to_idx, start, end, label):
+    """
+    Print the test header and match both station names.
+    Returns: (start_name, end_name), or None if either is not in the network.
+    """
+    print(f"\n=== {label} ===")
+    print(f"Input: {start} → {end}")
+
+    s_name = find_station_name(start, to_idx)
+    t_name = find_station_name(end, to_idx)
+    if s_name is None or t_name is None:
+        print("Station name not found in network.")
+        return None
+    return s_name, t_name
+
+
+def run_test(G, to_idx, to_name, start, end, label, method=route_dijkstra):
+    """
+    Print the shortest-time route from start to end.
+    method is one of the route_* functions above, called as method(G, s, t); bind
+    the extra argument of route_astar, route_ch, route_matrix or route_service
+    with functools.partial.
+    """
+    journey = find_journey(to_idx, start, end, label)
+    if journey is None:
+        return
+
+    s, t = to_idx[journey[0]], to_idx[journey[1]]
+    total, pred = method(G, s, t)
+
+    # CLRS path printer (no custom reconstruction)
+    route = print_path(pred, s, t, lambda i: to_name[i])
+
+    if not route:
+        print("No route found.")
+        return
+
+    print("Route:", " → ".join(route))
+    print("Total journey time:", total, "minutes")
+    print("Number of stations:", len(route))
+
+
+def run_alternatives_test(G, to_idx, to_name, start, end, label, k, route_cache=None):
+    """
+    Print the k fastest loopless routes from start to end.
+    route_cache is an optional dict reused across calls so repeated alternative
+    queries are cheap.
+    Returns: list of (minutes, station names), empty if there is no route.
+    """
+    journey = find_journey(to_idx, start, end, label)
+    if journey is None:
+        return []
+
+    s, t = to_idx[journey[0]], to_idx[journey[1]]
+    routes = [(minutes, [to_name[i] for i in path])
+              for minutes, path in yen_k_shortest_paths(G, s, t, k, cache=route_cache)]
+    if not routes:
+        print("No route found.")
+    for rank, (minutes, names) in enumerate(routes, 1):
+        print(f"Route {rank} ({minutes} minutes, {len(names)} stations):", " → ".join(names))
+    return routes
+
+
+def run_line_changes_test(lines, to_idx, start, end, label):
+    """
+    Print the fastest route from start to end with interchange time counted,
+    one leg per line ridden; lines comes from load_line_expanded_network.
+    """
+    journey = find_journey(to_idx, start, end, label)
+    if journey is None:
+        return
+
+    total, changes, path = route_with_changes(lines, *journey)
+    if not path:
+        print("No route found.")
+        return
+    _, node_station, node_line, _ = lines
+    # One leg per line ridden; interchange edges start a new leg.
+    legs = []
+    for v in path:
+        if legs and node_line[v] == legs[-1][0]:
+            legs[-1][1].append(node_station[v])
+        else:
+            legs.append((node_line[v], [node_station[v]]))
+    for line, stops in legs:
+        if len(stops) > 1:
+            print(f"  {line}: " + " → ".join(stops))
+    print("Total journey time:", total, "minutes")
+    print("Number of changes:", changes)
+
+
+# ---------- Main ----------
+def main():
+    # Try common filenames in the script folder
+    candidates = [
+        os.path.join(BASE, "London Underground data.xlsx"),
+        os.path.join(BASE, "London_Underground.xlsx"),
+        os.path.join(BASE, "London Underground.xlsx"),
+    ]
+    excel_file = next((p for p in candidates if os.path.exists(p)), None)
+    if excel_file is None:
+        # Let user provide a path if the common names aren't found
+        excel_file = input("Excel path: ").strip()
+
+    print(f"Loading London Underground network from '{excel_file}'...")
+    try:
+        G, to_idx, to_name = load_london_underground_from_excel(excel_file)
+        print(f"Network loaded. Stations: {len(to_idx)}")
+    except Exception as e:
+        print("Error loading Excel:", e)
+        print("Ensure the sheet has columns (From, To, Minutes) "
+              "or (Line, From, To, Minutes).")
+        return
+
+    # Spec asks for TWO tests: one short, one long
+    run_test(G, to_idx, to_name, "Covent Garden", "Leicester Square", "SHORT JOURNEY (CLRS Dijkstra)")
+    run_test(G, to_idx, to_name, "Wimbledon", "Stratford", "LONG JOURNEY (CLRS bidirectional Dijkstra)",
+             method=route_bidirectional)
+
+    # Same long journey answered from the preprocessed contraction hierarchy
+    ch = load_or_build_hierarchy(G, excel_file)
+    run_test(G, to_idx, to_name, "Wimbledon", "Stratford", "LONG JOURNEY (contraction hierarchy)",
+             method=partial(route_ch, ch=ch))
+
+    # Every station-to-station time at once (for dashboards); later runs hit the cache
+    matrix = load_or_compute_travel_matrix(G, excel_file)
+    run_test(G, to_idx, to_name, "Covent Garden", "Leicester Square", "SHORT JOURNEY (travel-time matrix)",
+             method=partial(route_matrix, matrix=matrix))
+
+    # Repeated journeys from the same origin are answered from the service's cache
+    service = JourneyService(G)
+    run_test(G, to_idx, to_name, "Wimbledon", "Stratford", "LONG JOURNEY (journey service)",
+             method=partial(route_service, service=service))
+    run_test(G, to_idx, to_name, "Wimbledon", "Bank", "WIMBLEDON → BANK (journey service, cached)",
+             method=partial(route_service, service=service))
+    print("Journey service cache:", service.stats())
+
+    # Alternatives for the long journey, e.g. when a segment is disrupted
+    run_alternatives_test(G, to_idx, to_name, "Wimbledon", "Stratford",
+                          "LONG JOURNEY (3 fastest alternatives)", k=3)
+
+    # Same long journey with line changes costed (default interchange time)
+    lines = load_line_expanded_network(excel_file)
+    run_line_changes_test(lines, to_idx, "Wimbledon", "Stratford", "LONG JOURNEY (line changes included)")
+
+    # Optional: A* on the long journey if a station-coordinates sidecar is present
+    coords_file = os.path.join(BASE, "London Underground coordinates.csv")
+    if os.path.exists(coords_file):
+        coords = load_station_coordinates(coords_file, to_idx)
+        max_speed = network_max_speed(G, coords)
+        run_test(G, to_idx, to_name, "Wimbledon", "Stratford", "LONG JOURNEY (A*, geographic heuristic)",
+                 method=partial(route_astar, coords=coords, max_speed=max_speed))
+
+    print("\nAll tests complete. Take screenshots of the outputs above for your report.")
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ import statistics
 from typing import List, Tuple, Optional
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 HERE = os.path.dirname(__file__)
@@ -23,7 +24,8 @@ CLRS_DIR = os.path.join(HERE, "clrsPython")
 if CLRS_DIR not in sys.path:
     sys.path.append(CLRS_DIR)
 
-from adjacency_list_graph import AdjacencyListGraph
+from clrsPython import (AdjacencyListGraph, CSRGraph, bfs_csr, bfs_direction_optimizing,
+                        bidirectional_bfs, multi_source_bfs)
 from bfs import bfs
 
 # ===========================================================================
@@ -61,16 +63,52 @@ def build_random_unweighted_graph(
     return G
 
 
+def build_random_unweighted_csr(
+    n: int,
+    edge_prob: float = 0.05
+) -> CSRGraph:
+    """
+    Array-built counterpart of build_random_unweighted_graph for large n:
+    the same chain plus random extra edges, drawn with NumPy instead of
+    testing all n^2 pairs, and stored directly as a CSRGraph.
+
+    For n in the hundreds of thousands, pass a small edge_prob (e.g. 5 / n)
+    so the expected number of edges stays manageable.
+    """
+    # Seed from the random module so run_experiment_3B's seed applies here too.
+    rng = np.random.default_rng(random.getrandbits(32))
+
+    chain = np.arange(n - 1, dtype=np.int64)
+    num_extra = rng.binomial(n * (n - 1) // 2, edge_prob) if n > 1 else 0
+    a = rng.integers(0, n, size=num_extra, dtype=np.int64)
+    b = rng.integers(0, n, size=num_extra, dtype=np.int64)
+    u, v = np.minimum(a, b), np.maximum(a, b)
+    # Drop self-loops, chain edges and repeats, as the (min, max) set does above.
+    keep = v > u + 1
+    pairs = np.unique(u[keep] * n + v[keep])
+
+    us = np.concatenate((chain, pairs // n))
+    vs = np.concatenate((chain + 1, pairs % n))
+    return CSRGraph.from_edges(n, us, vs, directed=False)
+
+
 def bfs_shortest_path_indices(
     G: AdjacencyListGraph,
     start_idx: int,
-    end_idx: int
+    end_idx: int,
+    bfs_func=None
 ) -> Tuple[Optional[int], Optional[List[int]]]:
     """
     Run BFS on an unweighted graph G from start_idx and reconstruct the
-    path to end_idx.
+    path to end_idx. A CSRGraph is searched with the vectorized bfs_csr
+    unless another bfs_func(G, s) -> (dist, pi) is given.
     """
-    dist, pi = bfs(G, start_idx)
+    if bfs_func is not None:
+        dist, pi = bfs_func(G, start_idx)
+    elif isinstance(G, CSRGraph):
+        dist, pi = bfs_csr(G, start_idx)
+    else:
+        dist, pi = bfs(G, start_idx)
 
     # In the CLRS BFS implementation, unreachable vertices have dist[v] = None.
     if dist[end_idx] is None:
@@ -89,15 +127,20 @@ def bfs_shortest_path_indices(
 def average_bfs_time(
     n: int,
     num_pairs: int = 50,
-    edge_prob: float = 0.05
+    edge_prob: float = 0.05,
+    use_csr: bool = False
 ) -> float:
     """
     For a random graph with n vertices:
 
-      - Build a random unweighted graph using build_random_unweighted_graph.
+      - Build a random unweighted graph using build_random_unweighted_graph
+        (or build_random_unweighted_csr if use_csr is set).
       - Returns the average time per BFS-based shortest-path calculation.
     """
-    G = build_random_unweighted_graph(n, edge_prob=edge_prob)
+    if use_csr:
+        G = build_random_unweighted_csr(n, edge_prob=edge_prob)
+    else:
+        G = build_random_unweighted_graph(n, edge_prob=edge_prob)
     times: List[float] = []
 
     for _ in range(num_pairs):
@@ -117,11 +160,48 @@ def average_bfs_time(
     return statistics.mean(times) if times else 0.0
 
 
+def compare_bfs_directions(
+    n: int,
+    num_pairs: int = 50,
+    edge_prob: float = 0.05,
+    alpha: float = 14,
+    beta: float = 24
+) -> Tuple[float, float]:
+    """
+    Time plain (top-down) BFS against direction-optimizing BFS on the
+    same random CSR graph and the same random station pairs.
+
+    Returns:
+        (average plain BFS time, average direction-optimizing BFS time)
+        in seconds per query.
+    """
+    G = build_random_unweighted_csr(n, edge_prob=edge_prob)
+
+    def direction_optimizing(graph, s):
+        return bfs_direction_optimizing(graph, s, alpha=alpha, beta=beta)
+
+    plain_times: List[float] = []
+    optimized_times: List[float] = []
+    for _ in range(num_pairs):
+        start_idx, end_idx = random.sample(range(n), 2)
+        for bfs_func, times in ((bfs_csr, plain_times),
+                                (direction_optimizing, optimized_times)):
+            t0 = time.perf_counter()
+            bfs_shortest_path_indices(G, start_idx, end_idx, bfs_func=bfs_func)
+            times.append(time.perf_counter() - t0)
+
+    return statistics.mean(plain_times), statistics.mean(optimized_times)
+
+
 def run_experiment_3B(
     sizes: Optional[List[int]] = None,
     num_pairs_per_n: int = 50,
     edge_prob: float = 0.05,
-    seed: Optional[int] = 123) -> pd.DataFrame:
+    seed: Optional[int] = 123,
+    use_csr: bool = False,
+    direction_optimizing: bool = False,
+    alpha: float = 14,
+    beta: float = 24) -> pd.DataFrame:
     """
     Run the scaling experiment on artificial networks.
 
@@ -130,8 +210,17 @@ def run_experiment_3B(
       - Measure the average time per BFS "fewest stops" calculation.
       - Record (n, average_time_seconds) in a DataFrame.
 
+    With use_csr, graphs are built as CSR arrays and searched with the
+    vectorized bfs_csr, which keeps sizes up to 10^6 stations practical
+    (with a correspondingly small edge_prob).
+
+    With direction_optimizing, each n is also benchmarked with
+    compare_bfs_directions (switch parameters alpha and beta), adding the
+    columns 'plain_bfs_seconds' and 'direction_optimizing_seconds'.
+
     Returns:
-        A DataFrame with columns ['n', 'average_time_seconds'].
+        A DataFrame with columns ['n', 'average_time_seconds'] (plus the
+        comparison columns above).
     """
     if sizes is None:
         sizes = list(range(100, 1100, 100))  # 100, 200, ..., 1000
@@ -143,13 +232,24 @@ def run_experiment_3B(
 
     print("\n=== Task 3B: Empirical BFS scaling on artificial unweighted networks ===")
     print(f"Running BFS experiments for n in {sizes}, "
-          f"{num_pairs_per_n} random pairs per n, edge_prob={edge_prob}.")
+          f"{num_pairs_per_n} random pairs per n, edge_prob={edge_prob}"
+          f"{', CSR' if use_csr else ''}.")
 
     for n in sizes:
-        avg_time = average_bfs_time(n, num_pairs=num_pairs_per_n, edge_prob=edge_prob)
+        avg_time = average_bfs_time(n, num_pairs=num_pairs_per_n, edge_prob=edge_prob,
+                                    use_csr=use_csr)
         print(f"Average BFS time for n={n}: {avg_time:.8f} seconds")
 
-        records.append({"n": n, "average_time_seconds": avg_time})
+        record = {"n": n, "average_time_seconds": avg_time}
+        if direction_optimizing:
+            plain, optimized = compare_bfs_directions(
+                n, num_pairs=num_pairs_per_n, edge_prob=edge_prob, alpha=alpha, beta=beta
+            )
+            print(f"  CSR BFS: plain {plain:.8f} s, "
+                  f"direction-optimizing {optimized:.8f} s")
+            record["plain_bfs_seconds"] = plain
+            record["direction_optimizing_seconds"] = optimized
+        records.append(record)
 
     df = pd.DataFrame.from_records(records)
     return df
@@ -204,8 +304,9 @@ def build_tube_graph(df: pd.DataFrame):
     id_to_station: dict[int, str] = {}
     next_id = 0
 
-    # A set is used to avoid duplicate edges.
-    edges = set()
+    # Edge endpoints; duplicates are removed when the graph is built.
+    us: List[int] = []
+    vs: List[int] = []
 
     for _, row in df.iterrows():
         # Expected format: [0: line, 1: from, 2: to, 3: time]
@@ -235,14 +336,12 @@ def build_tube_graph(df: pd.DataFrame):
 
         # Add edge if not a loop.
         if id_a != id_b:
-            e = (min(id_a, id_b), max(id_a, id_b))
-            edges.add(e)
+            us.append(id_a)
+            vs.append(id_b)
 
     n = next_id
-    graph = AdjacencyListGraph(n, directed=False)  # Unweighted for BFS
-
-    for id_a, id_b in edges:
-        graph.insert_edge(id_a, id_b)
+    # Unweighted for BFS; each undirected station pair becomes a single edge.
+    graph = AdjacencyListGraph.from_edges(n, us, vs, directed=False, dedupe="first")
 
     return graph, station_to_id, id_to_station
 
@@ -256,7 +355,8 @@ def print_real_route(
 ) -> None:
     """
     Print the path with the fewest stops between two real stations
-    using BFS on the unweighted graph built from the Excel data.
+    using bidirectional BFS on the unweighted graph built from the Excel
+    data, which only explores the stations around the two ends.
     """
     # Ensure correct formatting.
     start_label_str = start_label.strip()
@@ -271,18 +371,52 @@ def print_real_route(
     start_idx = station_to_id[start_label_str]
     end_idx = station_to_id[end_label_str]
 
-    # Run BFS to find the path with fewest stops.
-    stops, path_indices = bfs_shortest_path_indices(graph, start_idx, end_idx)
+    # Run bidirectional BFS to find the path with fewest stops.
+    stops, pi, visited = bidirectional_bfs(graph, start_idx, end_idx)
 
-    if stops is None or path_indices is None:
+    if stops is None:
         print(f"No path found from {start_label} to {end_label}.")
         return
 
+    path_indices: List[int] = [end_idx]
+    while path_indices[0] != start_idx:
+        path_indices.insert(0, pi[path_indices[0]])
+
     path_labels = [id_to_station[i] for i in path_indices]
 
     print(f"Path with fewest stops from {start_label} to {end_label}:")
     print(" -> ".join(path_labels))
     print(f"Total number of stops: {stops}")
+    print(f"Stations explored: {visited} of {graph.get_card_V()}")
+
+
+def nearest_facility_stops(
+    graph: AdjacencyListGraph,
+    station_to_id: dict,
+    id_to_station: dict,
+    facility_labels: List[str]
+) -> dict:
+    """
+    Number of stops from every station to its nearest facility station
+    (e.g. step-free or staffed stations), using one multi-source BFS
+    seeded with all facilities instead of one BFS per station.
+
+    Returns:
+        A dict mapping station name -> (stops, nearest facility name), with
+        (None, None) for stations that cannot reach any facility.
+    """
+    missing = [label for label in facility_labels
+               if label.strip() not in station_to_id]
+    if missing:
+        raise ValueError(f"Stations not in the dataset: {', '.join(missing)}")
+
+    sources = [station_to_id[label.strip()] for label in facility_labels]
+    dist, _, nearest = multi_source_bfs(graph, sources)
+
+    return {
+        id_to_station[v]: (dist[v], None if nearest[v] is None else id_to_station[nearest[v]])
+        for v in range(graph.get_card_V())
+    }
 
 
 def run_london_application() -> None:
@@ -317,6 +451,7 @@ def main() -> None:
         num_pairs_per_n=50,
         edge_prob=0.05,
         seed=123,
+        direction_optimizing=True,
     )
     df_scaling.to_csv(SCALING_CSV_PATH, index=False)
     print(f"\n3B scaling experiment data saved to {SCALING_CSV_PATH}")
@@ -1,193 +1,325 @@
-import pandas as pd
-from clrsPython import AdjacencyListGraph, kruskal, dijkstra
-
-# 🔧 update if you move the file
-EXCEL_PATH = r"London Underground data.xlsx"
-
-LONG_JOURNEY_START = "Wimbledon"
-LONG_JOURNEY_END = "Stratford"
-
-
-def load_simplified_network(excel_path):
-    """
-    Load 'London Underground data.xlsx' and produce:
-      - stations: list of unique station names
-      - edges: list of (u_name, v_name, duration) with one undirected edge
-               per pair, using the minimum duration.
-    """
-    df = pd.read_excel(
-        excel_path,
-        names=["Line", "Source", "Destination", "Duration (minutes)"]
-    )
-
-    # Drop rows where Destination is missing
-    df = df.dropna(subset=["Destination"])
-
-    # Canonical undirected endpoints (min, max) so source/dest order doesn't matter
-    df["u"] = df[["Source", "Destination"]].min(axis=1)
-    df["v"] = df[["Source", "Destination"]].max(axis=1)
-
-    # Keep minimum duration per undirected pair (u, v)
-    df_min = (
-        df.groupby(["u", "v"])["Duration (minutes)"]
-        .min()
-        .reset_index()
-    )
-
-    # Unique station names
-    stations = pd.concat([df_min["u"], df_min["v"]]).unique().tolist()
-
-    # Build edge list (undirected)
-    edges = []
-    for _, row in df_min.iterrows():
-        u_name = row["u"]
-        v_name = row["v"]
-        w = float(row["Duration (minutes)"])
-        edges.append((u_name, v_name, w))
-
-    return stations, edges
-
-
-def build_undirected_graph(stations, edges):
-    """
-    Build an AdjacencyListGraph from station names and (u, v, w) edges.
-    """
-    station_to_id = {name: i for i, name in enumerate(stations)}
-    id_to_station = {i: name for name, i in station_to_id.items()}
-
-    g = AdjacencyListGraph(len(stations), directed=False, weighted=True)
-
-    for u_name, v_name, w in edges:
-        u = station_to_id[u_name]
-        v = station_to_id[v_name]
-        g.insert_edge(u, v, w)
-
-    return g, station_to_id, id_to_station
-
-
-def extract_mst_edges_and_weight(mst_graph, id_to_station):
-    """
-    Extract MST edges and total MST weight.
-    Returns:
-      - mst_edges_named: list of (station_u, station_v)
-      - total_weight: float
-    """
-    edge_set = set()
-    total_weight = 0.0
-
-    for u in range(mst_graph.get_card_V()):
-        for edge in mst_graph.get_adj_list(u):
-            v = edge.get_v()
-            w = edge.get_weight()
-
-            a, b = sorted((u, v))
-            if (a, b) in edge_set:
-                continue  # skip duplicate undirected edge
-            edge_set.add((a, b))
-            total_weight += w
-
-    mst_edges_named = []
-    for a, b in edge_set:
-        mst_edges_named.append((id_to_station[a], id_to_station[b]))
-
-    return mst_edges_named, total_weight
-
-
-def shortest_path_dijkstra(graph, station_to_id, id_to_station, start_name, end_name):
-    """
-    Run Dijkstra using CLRS and reconstruct path and total time
-    between start_name and end_name.
-    """
-    if start_name not in station_to_id or end_name not in station_to_id:
-        raise ValueError(f"Start or end station not found: {start_name}, {end_name}")
-
-    start = station_to_id[start_name]
-    end = station_to_id[end_name]
-
-    dist, pi = dijkstra(graph, start)
-
-    # Reconstruct path
-    path_indices = []
-    current = end
-    while current is not None:
-        path_indices.insert(0, current)
-        if current == start:
-            break
-        current = pi[current]
-
-    path_names = [id_to_station[i] for i in path_indices]
-    total_time = dist[end]
-    return path_names, total_time
-
-
-def main():
-    # 1) Load and simplify London Underground network
-    stations, edges = load_simplified_network(EXCEL_PATH)
-    full_graph, station_to_id, id_to_station = build_undirected_graph(stations, edges)
-
-    # 2) Compute MST (core backbone)
-    mst_graph = kruskal(full_graph)
-    mst_edges_named, total_backbone_time = extract_mst_edges_and_weight(
-        mst_graph, id_to_station
-    )
-
-    print("Total journey time (weight) of core network backbone:")
-    print(total_backbone_time)
-
-    # 3) Compute redundant edges (present in original, not in MST)
-    mst_edge_set = {tuple(sorted(pair)) for pair in mst_edges_named}
-    original_edge_set = {
-        tuple(sorted((u, v))) for (u, v, _) in edges
-    }
-
-    redundant_pairs = original_edge_set - mst_edge_set
-
-    print("\nExample redundant connections:")
-    for i, (a, b) in enumerate(sorted(redundant_pairs)):
-        if i >= 10:
-            break
-        print(f"{a} -- {b}")
-
-    # 4) Impact analysis on one long journey
-    start_station = LONG_JOURNEY_START
-    end_station = LONG_JOURNEY_END
-
-    # Shortest path in full network
-    full_path, full_time = shortest_path_dijkstra(
-        full_graph, station_to_id, id_to_station, start_station, end_station
-    )
-
-    print(f"\nOriginal network shortest path from {start_station} to {end_station}:")
-    print(" -> ".join(full_path))
-    print(f"Total journey time: {full_time} minutes")
-
-    # Build MST-only graph with correct weights
-    mst_graph_only = AdjacencyListGraph(len(stations), directed=False, weighted=True)
-    # Add MST edges with their weights from the original edges list
-    edge_weight_lookup = {}
-    for (u_name, v_name, w) in edges:
-        a, b = sorted((u_name, v_name))
-        edge_weight_lookup[(a, b)] = w
-
-    for (u_name, v_name) in mst_edge_set:
-        a, b = sorted((u_name, v_name))
-        w = edge_weight_lookup[(a, b)]
-        u = station_to_id[u_name]
-        v = station_to_id[v_name]
-        mst_graph_only.insert_edge(u, v, w)
-
-    # Shortest path on backbone-only network
-    backbone_path, backbone_time = shortest_path_dijkstra(
-        mst_graph_only, station_to_id, id_to_station, start_station, end_station
-    )
-
-    print(f"\nBackbone-only network shortest path from {start_station} to {end_station}:")
-    print(" -> ".join(backbone_path))
-    print(f"Total journey time on backbone: {backbone_time} minutes")
-
-    print("\nImpact analysis:")
-    print(f"Extra journey time when using backbone only: {backbone_time - full_time} minutes")
-
-
-if __name__ == "__main__":
-    main()
+import numpy as np
+import pandas as pd
+from clrsPython import (AdjacencyListGraph, kruskal_edges, dijkstra, IncrementalMST,
+                        all_pairs_shortest_paths, yen_k_shortest_paths)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional; CSV is always available
+    pq = None
+
+# 🔧 update if you move the file
+EXCEL_PATH = r"London Underground data.xlsx"
+
+LONG_JOURNEY_START = "Wimbledon"
+LONG_JOURNEY_END = "Stratford"
+
+# Example "what if we close this link" query for the operations team
+CLOSURE_EXAMPLE = ("Bank", "Liverpool Street")
+
+# Network-wide backbone impact: output file and OD sample size (None = all pairs)
+IMPACT_OUTPUT = "backbone_impact.csv"
+IMPACT_SAMPLE_PAIRS = None
+IMPACT_PERCENTILES = (50, 90, 95, 99, 100)
+
+
+def load_simplified_network(excel_path):
+    """
+    Load 'London Underground data.xlsx' and produce:
+      - stations: list of unique station names
+      - edges: list of (u_name, v_name, duration) with one undirected edge
+               per pair, using the minimum duration.
+    """
+    df = pd.read_excel(
+        excel_path,
+        names=["Line", "Source", "Destination", "Duration (minutes)"]
+    )
+
+    # Drop rows where Destination is missing
+    df = df.dropna(subset=["Destination"])
+
+    # Canonical undirected endpoints (min, max) so source/dest order doesn't matter
+    df["u"] = df[["Source", "Destination"]].min(axis=1)
+    df["v"] = df[["Source", "Destination"]].max(axis=1)
+
+    # Keep minimum duration per undirected pair (u, v)
+    df_min = (
+        df.groupby(["u", "v"])["Duration (minutes)"]
+        .min()
+        .reset_index()
+    )
+
+    # Unique station names
+    stations = pd.concat([df_min["u"], df_min["v"]]).unique().tolist()
+
+    # Build edge list (undirected)
+    edges = []
+    for _, row in df_min.iterrows():
+        u_name = row["u"]
+        v_name = row["v"]
+        w = float(row["Duration (minutes)"])
+        edges.append((u_name, v_name, w))
+
+    return stations, edges
+
+
+def build_undirected_graph(stations, edges):
+    """
+    Build an AdjacencyListGraph from station names and (u, v, w) edges.
+    """
+    station_to_id = {name: i for i, name in enumerate(stations)}
+    id_to_station = {i: name for name, i in station_to_id.items()}
+
+    us = [station_to_id[u_name] for u_name, _, _ in edges]
+    vs = [station_to_id[v_name] for _, v_name, _ in edges]
+    ws = [w for _, _, w in edges]
+    g = AdjacencyListGraph.from_edges(
+        len(stations), us, vs, ws, directed=False, weighted=True, dedupe="min"
+    )
+
+    return g, station_to_id, id_to_station
+
+
+def extract_mst_edges_and_weight(mst_edges, id_to_station):
+    """
+    Name the MST edges returned by kruskal_edges and sum their weights.
+    Returns:
+      - mst_edges_named: list of (station_u, station_v)
+      - total_weight: float
+    """
+    total_weight = 0.0
+    mst_edges_named = []
+
+    for u, v, w in mst_edges:
+        mst_edges_named.append((id_to_station[u], id_to_station[v]))
+        total_weight += w
+
+    return mst_edges_named, total_weight
+
+
+def shortest_path_dijkstra(graph, station_to_id, id_to_station, start_name, end_name, k=1):
+    """
+    Run Dijkstra using CLRS and reconstruct path and total time
+    between start_name and end_name.
+    With k > 1, return the k fastest loopless routes (Yen's algorithm)
+    as a ranked list of (path_names, total_time) instead.
+    """
+    if start_name not in station_to_id or end_name not in station_to_id:
+        raise ValueError(f"Start or end station not found: {start_name}, {end_name}")
+
+    start = station_to_id[start_name]
+    end = station_to_id[end_name]
+
+    if k > 1:
+        return [
+            ([id_to_station[i] for i in path], total_time)
+            for total_time, path in yen_k_shortest_paths(graph, start, end, k)
+        ]
+
+    dist, pi, _ = dijkstra(graph, start, targets=[end])
+
+    # Reconstruct path
+    path_indices = []
+    current = end
+    while current is not None:
+        path_indices.insert(0, current)
+        if current == start:
+            break
+        current = pi[current]
+
+    path_names = [id_to_station[i] for i in path_indices]
+    total_time = dist[end]
+    return path_names, total_time
+
+
+def report_link_closure(backbone, station_to_id, id_to_station, u_name, v_name):
+    """
+    Close the link u_name -- v_name on an IncrementalMST backbone (no rebuild),
+    print the new backbone weight and redundant-link count, then reopen it.
+    """
+    if u_name not in station_to_id or v_name not in station_to_id:
+        raise ValueError(f"Station not found: {u_name}, {v_name}")
+    u, v = station_to_id[u_name], station_to_id[v_name]
+
+    before = backbone.get_total_weight()
+    tree_before = {(a, b) for a, b, _ in backbone.get_tree_edges()}
+    weights = {(a, b): w for a, b, w in backbone.get_tree_edges() + backbone.get_redundant_edges()}
+    if (min(u, v), max(u, v)) not in weights:
+        raise ValueError(f"No link between {u_name} and {v_name}")
+    weight = weights[(min(u, v), max(u, v))]
+
+    after = backbone.close_edge(u, v)
+    print(f"\nClosing {u_name} -- {v_name}:")
+    print(f"Backbone weight {before} -> {after}")
+    print(f"Redundant connections remaining: {len(backbone.get_redundant_edges())}")
+    for a, b, _ in backbone.get_tree_edges():
+        if (a, b) not in tree_before:
+            print(f"Replacement backbone link: {id_to_station[a]} -- {id_to_station[b]}")
+
+    # Reopen so the backbone is back to its original state.
+    backbone.open_edge(u, v, weight)
+
+
+def sample_od_pairs(n, num_pairs, seed=0):
+    """
+    Draw num_pairs distinct station pairs (u < v) at random, grouped by origin.
+    Returns {origin: array of destinations}.
+    """
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    num_pairs = min(num_pairs, total)
+    # Decode pair ranks in the upper triangle back to (u, v).
+    ranks = rng.choice(total, size=num_pairs, replace=False)
+    us, vs = np.triu_indices(n, k=1)
+    od = {}
+    for u, v in sorted(zip(us[ranks].tolist(), vs[ranks].tolist())):
+        od.setdefault(u, []).append(v)
+    return {u: np.array(dests) for u, dests in od.items()}
+
+
+def backbone_impact_analysis(full_graph, mst_graph, id_to_station, out_path=IMPACT_OUTPUT,
+                             sample_pairs=None, seed=0, processes=None, batch_size=64):
+    """
+    Journey-time delta between the full network and the backbone-only network
+    for every station pair (or a random sample of sample_pairs pairs).
+
+    Per-source shortest paths are run in parallel on both graphs. Rows of
+    (from, to, full_minutes, backbone_minutes, extra_minutes) are streamed to
+    out_path one batch of origins at a time: Parquet if out_path ends in
+    .parquet and pyarrow is installed, CSV otherwise.
+    Returns {percentile: extra minutes} for IMPACT_PERCENTILES.
+    """
+    n = len(id_to_station)
+    # Both graphs are undirected, so each unordered pair is computed once.
+    if sample_pairs is None:
+        od = {u: np.arange(u + 1, n) for u in range(n - 1)}
+    else:
+        od = sample_od_pairs(n, sample_pairs, seed)
+    origins = list(od)
+
+    full_dist, _ = all_pairs_shortest_paths(full_graph, processes=processes, sources=origins)
+    mst_dist, _ = all_pairs_shortest_paths(mst_graph, processes=processes, sources=origins)
+
+    use_parquet = out_path.endswith(".parquet")
+    if use_parquet and pq is None:
+        out_path = out_path[: -len(".parquet")] + ".csv"
+        use_parquet = False
+        print(f"pyarrow is not installed; writing {out_path} instead")
+
+    names = np.array([id_to_station[i] for i in range(n)], dtype=object)
+    extras = []
+    writer = None
+    for start in range(0, len(origins), batch_size):
+        rows = range(start, min(start + batch_size, len(origins)))
+        src = np.concatenate([np.full(len(od[origins[r]]), origins[r]) for r in rows])
+        dst = np.concatenate([od[origins[r]] for r in rows])
+        row_idx = np.concatenate([np.full(len(od[origins[r]]), r) for r in rows])
+        full_minutes = full_dist[row_idx, dst]
+        backbone_minutes = mst_dist[row_idx, dst]
+        extra = backbone_minutes - full_minutes
+        extras.append(extra)
+
+        batch = pd.DataFrame({
+            "from": names[src],
+            "to": names[dst],
+            "full_minutes": full_minutes,
+            "backbone_minutes": backbone_minutes,
+            "extra_minutes": extra,
+        })
+        if use_parquet:
+            table = pa.Table.from_pandas(batch, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out_path, table.schema)
+            writer.write_table(table)
+        else:
+            batch.to_csv(out_path, mode="w" if start == 0 else "a",
+                         header=start == 0, index=False)
+    if writer is not None:
+        writer.close()
+
+    extras = np.concatenate(extras) if extras else np.zeros(0, dtype=np.float32)
+    print(f"\nBackbone impact over {len(extras)} station pairs (written to {out_path}):")
+    if len(extras) == 0:
+        return {}
+    percentiles = dict(zip(IMPACT_PERCENTILES, np.percentile(extras, IMPACT_PERCENTILES).tolist()))
+    for q, minutes in percentiles.items():
+        print(f"  p{q} extra journey time: {minutes:.1f} minutes")
+    print(f"  pairs slowed down: {np.count_nonzero(extras > 0)}")
+    return percentiles
+
+
+def main():
+    # 1) Load and simplify London Underground network
+    stations, edges = load_simplified_network(EXCEL_PATH)
+    full_graph, station_to_id, id_to_station = build_undirected_graph(stations, edges)
+
+    # 2) Compute MST (core backbone) as an edge array
+    mst_edges = kruskal_edges(full_graph)
+    mst_edges_named, total_backbone_time = extract_mst_edges_and_weight(
+        mst_edges, id_to_station
+    )
+
+    print("Total journey time (weight) of core network backbone:")
+    print(total_backbone_time)
+
+    # 3) Compute redundant edges (present in original, not in MST)
+    mst_edge_set = {tuple(sorted(pair)) for pair in mst_edges_named}
+    original_edge_set = {
+        tuple(sorted((u, v))) for (u, v, _) in edges
+    }
+
+    redundant_pairs = original_edge_set - mst_edge_set
+
+    print("\nExample redundant connections:")
+    for i, (a, b) in enumerate(sorted(redundant_pairs)):
+        if i >= 10:
+            break
+        print(f"{a} -- {b}")
+
+    # 4) Impact analysis on one long journey
+    start_station = LONG_JOURNEY_START
+    end_station = LONG_JOURNEY_END
+
+    # Shortest path in full network
+    full_path, full_time = shortest_path_dijkstra(
+        full_graph, station_to_id, id_to_station, start_station, end_station
+    )
+
+    print(f"\nOriginal network shortest path from {start_station} to {end_station}:")
+    print(" -> ".join(full_path))
+    print(f"Total journey time: {full_time} minutes")
+
+    # Build MST-only graph; the MST edges already carry their weights
+    mst_graph_only = AdjacencyListGraph.from_edges(
+        len(stations),
+        [u for u, _, _ in mst_edges],
+        [v for _, v, _ in mst_edges],
+        [w for _, _, w in mst_edges],
+        directed=False, weighted=True,
+    )
+
+    # Shortest path on backbone-only network
+    backbone_path, backbone_time = shortest_path_dijkstra(
+        mst_graph_only, station_to_id, id_to_station, start_station, end_station
+    )
+
+    print(f"\nBackbone-only network shortest path from {start_station} to {end_station}:")
+    print(" -> ".join(backbone_path))
+    print(f"Total journey time on backbone: {backbone_time} minutes")
+
+    print("\nImpact analysis:")
+    print(f"Extra journey time when using backbone only: {backbone_time - full_time} minutes")
+
+    # 5) Link-closure query answered incrementally from the current backbone
+    backbone = IncrementalMST(full_graph, mst_edges)
+    report_link_closure(backbone, station_to_id, id_to_station, *CLOSURE_EXAMPLE)
+
+    # 6) Impact analysis over every station pair (or a sampled OD matrix)
+    backbone_impact_analysis(
+        full_graph, mst_graph_only, id_to_station, sample_pairs=IMPACT_SAMPLE_PAIRS
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Contraction hierarchies (CH) for fast point-to-point shortest paths on a static,
+weighted graph such as the London Underground network from 2bexcel.py.
+
+Preprocessing (offline, once per map):
+  - Vertices are contracted one at a time, least "important" first.
+  - Contracting v removes it from the remaining graph; for each pair of
+    neighbours u -> v -> x whose only shortest connection runs through v,
+    a shortcut u -> x is added that remembers v as its middle vertex.
+  - The order in which vertices are contracted is their rank.
+
+Query (online, many times):
+  - A bidirectional Dijkstra that only follows edges towards higher-ranked
+    vertices, forward from the source and backward from the target.
+  - Shortcuts on the best path are unpacked recursively into original edges.
+
+The hierarchy is saved to / loaded from a compressed .npz file.
+"""
+from heapq import heappush, heappop
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+INF = float('inf')
+
+
+class ContractionHierarchy:
+    """Upward search graphs plus shortcut middles, produced by build()."""
+
+    def __init__(self, rank, up_out, up_in, directed, source=""):
+        """
+        rank    -- rank[v] is the position of v in the contraction order
+        up_out  -- up_out[u] is a list of (x, weight, middle) with rank[x] > rank[u]
+                   for edges u -> x (middle is None for an original edge)
+        up_in   -- up_in[x] is a list of (u, weight, middle) with rank[u] > rank[x]
+                   for edges u -> x
+        directed -- whether the original graph is directed
+        source  -- free-form tag describing the input (e.g. a file hash)
+        """
+        self.rank = rank
+        self.up_out = up_out
+        self.up_in = up_in
+        self.directed = directed
+        self.source = source
+        self.card_V = len(rank)
+
+    # ------------------------------------------------------------------
+    # Preprocessing
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(cls, G, witness_limit: int = 500, source: str = "") -> "ContractionHierarchy":
+        """
+        Contract every vertex of the weighted graph G (AdjacencyListGraph or
+        CSRGraph) and return the hierarchy.
+
+        witness_limit bounds the number of vertices settled by each witness
+        search; a search that gives up just adds a (possibly redundant) shortcut,
+        so a small limit costs query speed, never correctness.
+        """
+        n = G.get_card_V()
+        directed = G.is_directed()
+
+        # Remaining graph: out_adj[u][x] = (weight, middle), in_adj mirrors it.
+        out_adj: List[Dict[int, Tuple[float, Optional[int]]]] = [{} for _ in range(n)]
+        in_adj: List[Dict[int, Tuple[float, Optional[int]]]] = [{} for _ in range(n)]
+        for u in range(n):
+            for edge in G.get_adj_list(u):
+                x, w = edge.get_v(), edge.get_weight()
+                if x != u and (x not in out_adj[u] or w < out_adj[u][x][0]):
+                    out_adj[u][x] = (w, None)
+                    in_adj[x][u] = (w, None)
+
+        contracted = [False] * n
+        deleted_neighbours = [0] * n
+        rank = [0] * n
+        up_out: List[list] = [[] for _ in range(n)]
+        up_in: List[list] = [[] for _ in range(n)]
+
+        def witness_distances(u, skip, bound):
+            """Distances from u in the remaining graph avoiding skip, up to bound."""
+            dist = {u: 0}
+            heap = [(0, u)]
+            settled = 0
+            while heap and settled < witness_limit:
+                du, a = heappop(heap)
+                if du > dist[a]:
+                    continue
+                if du > bound:
+                    break
+                settled += 1
+                for b, (w, _) in out_adj[a].items():
+                    if b == skip:
+                        continue
+                    db = du + w
+                    if db < dist.get(b, INF):
+                        dist[b] = db
+                        heappush(heap, (db, b))
+            return dist
+
+        def shortcuts_for(v):
+            """Shortcuts (u, x, weight) needed if v were contracted now."""
+            needed = []
+            outs = list(out_adj[v].items())
+            if not outs:
+                return needed
+            max_out = max(w for _, (w, _) in outs)
+            for u, (w_uv, _) in in_adj[v].items():
+                dist = witness_distances(u, v, w_uv + max_out)
+                for x, (w_vx, _) in outs:
+                    if x == u:
+                        continue
+                    via_v = w_uv + w_vx
+                    if dist.get(x, INF) > via_v:
+                        needed.append((u, x, via_v))
+            return needed
+
+        def priority(v, shortcuts):
+            """Edge difference plus contracted-neighbour count (smaller goes first)."""
+            removed = len(out_adj[v]) + len(in_adj[v])
+            return len(shortcuts) - removed + deleted_neighbours[v]
+
+        heap = [(priority(v, shortcuts_for(v)), v) for v in range(n)]
+        heap.sort()
+        order = 0
+        while heap:
+            _, v = heappop(heap)
+            if contracted[v]:
+                continue
+            # Lazy update: re-evaluate v and put it back if it is no longer the best.
+            shortcuts = shortcuts_for(v)
+            p = priority(v, shortcuts)
+            if heap and p > heap[0][0]:
+                heappush(heap, (p, v))
+                continue
+
+            for u, x, w in shortcuts:
+                if w < out_adj[u].get(x, (INF, None))[0]:
+                    out_adj[u][x] = (w, v)
+                    in_adj[x][u] = (w, v)
+
+            # Every remaining neighbour of v is contracted later, so it ranks higher.
+            rank[v] = order
+            order += 1
+            contracted[v] = True
+            for x, (w, mid) in out_adj[v].items():
+                up_out[v].append((x, w, mid))
+                del in_adj[x][v]
+                deleted_neighbours[x] += 1
+            for u, (w, mid) in in_adj[v].items():
+                up_in[v].append((u, w, mid))
+                del out_adj[u][v]
+                deleted_neighbours[u] += 1
+            out_adj[v] = {}
+            in_adj[v] = {}
+
+        return cls(rank, up_out, up_in, directed, source)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def query(self, s: int, t: int):
+        """
+        Shortest path from s to t.
+
+        Returns (distance, pi, settled) like clrsPython.bidirectional_dijkstra:
+        distance is infinity if t is unreachable, pi is set along the unpacked
+        path so that print_path can walk it, and settled counts settled vertices.
+        """
+        pi: List[Optional[int]] = [None] * self.card_V
+        if s == t:
+            return 0, pi, 1
+
+        graphs = (self.up_out, self.up_in)
+        d = ({s: 0}, {t: 0})
+        pred = ({s: None}, {t: None})
+        heaps = ([(0, s)], [(0, t)])
+        done = (set(), set())
+        best = INF
+        meet = None
+        settled = 0
+
+        # Upward searches cannot stop at the first meeting vertex; each side runs
+        # until its smallest tentative distance is no better than the best path.
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                if heap[0][0] >= best:
+                    heap.clear()
+                    continue
+                du, u = heappop(heap)
+                if u in done[side]:
+                    continue
+                done[side].add(u)
+                settled += 1
+                if u in d[1 - side] and du + d[1 - side][u] < best:
+                    best = du + d[1 - side][u]
+                    meet = u
+                for x, w, _ in graphs[side][u]:
+                    dx = du + w
+                    if dx < d[side].get(x, INF):
+                        d[side][x] = dx
+                        pred[side][x] = u
+                        heappush(heap, (dx, x))
+
+        if meet is None:
+            return INF, pi, settled
+
+        # Upward path s -> meet, then meet -> t, both in hierarchy edges.
+        up = [meet]
+        while up[-1] != s:
+            up.append(pred[0][up[-1]])
+        up.reverse()
+        x = meet
+        while x != t:
+            x = pred[1][x]
+            up.append(x)
+
+        # With zero-weight edges the unpacked path can return to a vertex it has
+        # already visited; such a loop costs 0, so cut it out rather than write a
+        # cycle into pi.
+        path = [s]
+        position = {s: 0}
+        for a, b in zip(up, up[1:]):
+            for v in self.unpack(a, b)[1:]:
+                if v in position:
+                    for y in path[position[v] + 1:]:
+                        del position[y]
+                    del path[position[v] + 1:]
+                else:
+                    position[v] = len(path)
+                    path.append(v)
+        for a, b in zip(path, path[1:]):
+            pi[b] = a
+        return best, pi, settled
+
+    def _edge(self, u: int, x: int):
+        """(weight, middle) of hierarchy edge u -> x."""
+        if self.rank[x] > self.rank[u]:
+            candidates, key = self.up_out[u], x
+        else:
+            candidates, key = self.up_in[x], u
+        for y, w, mid in candidates:
+            if y == key:
+                return w, mid
+        raise KeyError(f"No hierarchy edge ({u}, {x})")
+
+    def unpack(self, u: int, x: int) -> List[int]:
+        """Vertices of the original path represented by hierarchy edge u -> x."""
+        path = [u]
+        stack = [(u, x)]
+        while stack:
+            a, b = stack.pop()
+            _, mid = self._edge(a, b)
+            if mid is None:
+                path.append(b)
+            else:
+                # Expand (a, mid) before (mid, b).
+                stack.append((mid, b))
+                stack.append((a, mid))
+        return path
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _to_csr(lists):
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(lst) for lst in lists])
+        ends = np.array([y for lst in lists for y, _, _ in lst], dtype=np.int64)
+        weights = np.array([w for lst in lists for _, w, _ in lst], dtype=np.float64)
+        middles = np.array([-1 if m is None else m for lst in lists for _, _, m in lst], dtype=np.int64)
+        return offsets, ends, weights, middles
+
+    @staticmethod
+    def _from_csr(offsets, ends, weights, middles):
+        ends, weights, middles = ends.tolist(), weights.tolist(), middles.tolist()
+        lists = []
+        for i in range(len(offsets) - 1):
+            lo, hi = int(offsets[i]), int(offsets[i + 1])
+            lists.append([(ends[j], weights[j], None if middles[j] < 0 else middles[j])
+                          for j in range(lo, hi)])
+        return lists
+
+    def save(self, path: str) -> None:
+        """Write the hierarchy to a compressed .npz file."""
+        out = self._to_csr(self.up_out)
+        inc = self._to_csr(self.up_in)
+        np.savez_compressed(
+            path,
+            rank=np.array(self.rank, dtype=np.int64),
+            out_offsets=out[0], out_ends=out[1], out_weights=out[2], out_middles=out[3],
+            in_offsets=inc[0], in_ends=inc[1], in_weights=inc[2], in_middles=inc[3],
+            directed=np.array(self.directed),
+            source=np.array(self.source),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        """Read a hierarchy written by save()."""
+        with np.load(path) as data:
+            up_out = cls._from_csr(data["out_offsets"], data["out_ends"],
+                                   data["out_weights"], data["out_middles"])
+            up_in = cls._from_csr(data["in_offsets"], data["in_ends"],
+                                  data["in_weights"], data["in_middles"])
+            return cls(data["rank"].tolist(), up_out, up_in,
+                       bool(data["directed"]), str(data["source"]))
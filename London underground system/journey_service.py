@@ -0,0 +1,125 @@
+"""
+Journey service: answers station-to-station queries from cached
+shortest-path trees.
+
+Query logs are dominated by a few hundred origin-destination pairs, so
+instead of running Dijkstra for every query, the service keeps the full
+(dist, pred) arrays of recently used sources in a bounded LRU cache.
+Any later journey from a cached source is then an O(path) walk of pred.
+
+Entries are keyed by (graph version, source). Every insert_edge,
+delete_edge or Edge.set_weight bumps the graph's version, so results
+computed before a change are never served as they are. If the graph
+keeps a change log covering the changes, each cached tree is checked
+against them and kept if they cannot affect it (e.g. a new edge that is
+no shortcut, or a deleted edge off the tree); otherwise it is dropped.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from clrsPython import dijkstra_fast
+
+
+class JourneyService:
+    """Shortest journeys on a graph, with an LRU cache of shortest-path trees."""
+
+    def __init__(self, G, capacity: int = 256,
+                 shortest_paths: Callable = dijkstra_fast):
+        """
+        G              -- weighted graph with get_version() (AdjacencyListGraph or CSRGraph)
+        capacity       -- maximum number of sources whose (dist, pred) are kept
+        shortest_paths -- single-source solver, called as shortest_paths(G, s)
+                          and returning (dist, pred)
+        """
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        self.G = G
+        self.capacity = capacity
+        self.shortest_paths = shortest_paths
+        self.cache: "OrderedDict[Tuple[int, int], Tuple[list, list]]" = OrderedDict()
+        self.cached_version = G.get_version()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.revalidations = 0
+
+    def shortest_path_tree(self, s: int) -> Tuple[list, list]:
+        """(dist, pred) from source s, from the cache if the graph is unchanged."""
+        version = self.G.get_version()
+        if version != self.cached_version:
+            self._revalidate(version)
+
+        key = (version, s)
+        tree = self.cache.get(key)
+        if tree is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return tree
+
+        self.misses += 1
+        tree = self.shortest_paths(self.G, s)
+        self.cache[key] = tree
+        if len(self.cache) > self.capacity:
+            self.cache.popitem(last=False)  # least recently used
+            self.evictions += 1
+        return tree
+
+    def _revalidate(self, version: int) -> None:
+        """Carry over the cached trees that the graph's changes leave correct."""
+        changes = None
+        if hasattr(self.G, "get_changes_since"):
+            changes = self.G.get_changes_since(self.cached_version)
+        kept: "OrderedDict[Tuple[int, int], Tuple[list, list]]" = OrderedDict()
+        if changes is not None:
+            for (_, s), tree in self.cache.items():
+                if all(self._tree_survives(tree, change) for change in changes):
+                    kept[(version, s)] = tree
+        self.revalidations += len(kept)
+        self.invalidations += len(self.cache) - len(kept)
+        self.cache = kept
+        self.cached_version = version
+
+    def _tree_survives(self, tree: Tuple[list, list], change: tuple) -> bool:
+        """Whether a shortest-path tree is still correct after one logged edge change."""
+        dist, pred = tree
+        _, kind, u, v, weight, old_weight = change
+        if kind == "reweight":
+            # Only the edge u -> v changed; it must stay off the tree and be no shortcut.
+            return pred[v] != u and not dist[u] + weight < dist[v]
+        arcs = [(u, v)] if self.G.is_directed() else [(u, v), (v, u)]
+        if kind == "insert":
+            return all(not dist[a] + weight < dist[b] for a, b in arcs)
+        # "delete": harmless unless the edge was on the tree.
+        return all(pred[b] != a for a, b in arcs)
+
+    def journey(self, s: int, t: int) -> Tuple[float, Optional[List[int]]]:
+        """
+        Shortest journey from s to t.
+        Returns (distance, path); distance is infinity and path is None if
+        t is unreachable.
+        """
+        dist, pred = self.shortest_path_tree(s)
+        if dist[t] == float('inf'):
+            return dist[t], None
+        path = [t]
+        while path[-1] != s:
+            path.append(pred[path[-1]])
+        path.reverse()
+        return dist[t], path
+
+    def clear(self) -> None:
+        """Drop every cached tree (the counters are kept)."""
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss, eviction, invalidation and revalidation counts, plus the current
+        cache size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "revalidations": self.revalidations,
+            "size": len(self.cache),
+        }
@@ -0,0 +1,37 @@
+# Regression tests for ContractionHierarchy.query on graphs with zero-weight edges.
+
+import random
+
+from clrsPython import AdjacencyListGraph, dijkstra_fast
+from contraction_hierarchy import ContractionHierarchy
+
+
+def path_to(pi, s, t):
+    path = [t]
+    while path[-1] != s:
+        path.append(pi[path[-1]])
+        assert len(path) <= len(pi), "pi has a cycle"
+    path.reverse()
+    return path
+
+
+def test_zero_weight_edges_give_a_simple_path():
+    rng = random.Random(3)
+    for _ in range(100):
+        n = 12
+        G = AdjacencyListGraph(n, directed=False, weighted=True)
+        for u in range(n - 1):
+            G.insert_edge(u, u + 1, rng.choice([0, 0, 1, 2]))
+        for _ in range(15):
+            u, v = rng.sample(range(n), 2)
+            if not G.has_edge(u, v):
+                G.insert_edge(u, v, rng.choice([0, 0, 1, 2]))
+        ch = ContractionHierarchy.build(G)
+        for s in range(n):
+            d, _ = dijkstra_fast(G, s)
+            for t in range(n):
+                total, pi, _ = ch.query(s, t)
+                assert total == d[t]
+                path = path_to(pi, s, t)
+                assert len(set(path)) == len(path)
+                assert sum(G.find_edge(a, b).weight for a, b in zip(path, path[1:])) == total
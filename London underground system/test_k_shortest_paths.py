@@ -0,0 +1,36 @@
+# Regression tests for yen_k_shortest_paths with a spur cache shared across queries.
+
+import random
+
+from clrsPython import AdjacencyListGraph, yen_k_shortest_paths
+
+
+def random_graph(rng, n=8, m=20):
+    G = AdjacencyListGraph(n, directed=False, weighted=True)
+    for u in range(n - 1):
+        G.insert_edge(u, u + 1, rng.randint(1, 9))
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        if not G.has_edge(u, v):
+            G.insert_edge(u, v, rng.randint(1, 9))
+    return G
+
+
+def test_shared_cache_matches_fresh_cache_for_every_target():
+    rng = random.Random(1)
+    for _ in range(50):
+        G = random_graph(rng)
+        cache = {}
+        for t in range(1, G.get_card_V()):
+            routes = yen_k_shortest_paths(G, 0, t, 4, cache=cache)
+            assert routes == yen_k_shortest_paths(G, 0, t, 4)
+            assert all(path[0] == 0 and path[-1] == t for _, path in routes)
+
+
+def test_shared_cache_is_not_reused_after_the_graph_changes():
+    rng = random.Random(2)
+    G = random_graph(rng)
+    cache = {}
+    _, best_path = yen_k_shortest_paths(G, 0, 5, 4, cache=cache)[0]
+    G.delete_edge(best_path[0], best_path[1])
+    assert yen_k_shortest_paths(G, 0, 5, 4, cache=cache) == yen_k_shortest_paths(G, 0, 5, 4)